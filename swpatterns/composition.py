@@ -30,8 +30,9 @@ print(c.testa + c.testb)     # > 123456
 print(c._a.test + c._b.test) # > 123456
 """
 
+from functools import lru_cache, partial
 from operator import attrgetter
-from typing import Union, Tuple, Any, Dict
+from typing import Union, Tuple, Any, Dict, Optional, Callable, Sequence
 
 from .interface import InterfaceMeta, isimplementation
 
@@ -43,8 +44,8 @@ def Compose(
     *fields: Union[str, Tuple[str, str]],
     name: str = None,
     build: bool = True,
-    args: Tuple = tuple(),
-    kwargs: Dict[str, Any] = dict(),
+    args: Optional[Tuple] = None,
+    kwargs: Optional[Dict[str, Any]] = None,
 ) -> type:
     """Generate a new type that encompasses the forwarding of the given fields
     
@@ -52,46 +53,126 @@ def Compose(
     :param *fields: the fields to forward
     :param name: the name to give the composee, defaults to f"_{type_.__name__.lower()}"
     :param build: enable the automatic generation of a composee instance, doesn nothing when an interface is supplied
-    :param args: the positional arguments to call the constructor of type_ with, defaults to tuple()
-    :param kwargs: the keyword arguments to call the constructor of type_ with, defaults to dict()
+    :param args: the positional arguments to call the constructor of type_ with, defaults to no arguments
+    :param kwargs: the keyword arguments to call the constructor of type_ with, defaults to no arguments
     :return: the inheritable type
     """
+    args = args or ()
+    kwargs = kwargs or {}
     name_ = name or f"_{type_.__name__.lower()}"
     fields_ = [
         (field, field) if not isinstance(field, tuple) else field for field in fields
     ]
+    if not args and not kwargs:
+        # only compositions without constructor arguments are cached, equal but
+        # distinct arguments (1, True, 1.0, ...) must not share a type
+        return _cached_composition(type_, tuple(fields_), name_, bool(build))
+    return _composition(type_, fields_, name_, build, args, kwargs)
 
-    class InheritableComposition:
-        def __init_subclass__(cls):
-            super().__init_subclass__()
-            for origin, dest in fields_:
-                setattr(cls, dest, _build_field(name_, origin))
-
-        def __init__(self, *args_, **kwargs_):
-            obj = kwargs_.pop(name_, None)
-            if not obj:
-                if build and not isinstance(type_, InterfaceMeta):
-                    obj = type_(*args, **kwargs)
-                else:
-                    raise ValueError(
-                        f"Need to provide a instance of type {type_} under kwarg {name_}."
-                    )
-            elif isinstance(type_, InterfaceMeta) and not isimplementation(
-                type(obj), type_
-            ):
-                raise TypeError(f"Passed instance doesn't implement {type_}")
-            if any(not hasattr(obj, attr) for attr, _ in fields_):
+
+@lru_cache(maxsize=128)
+def _cached_composition(
+    type_: type, fields_: Tuple[Tuple[str, str], ...], name_: str, build: bool
+) -> type:
+    """Build a composition without constructor arguments, see _composition.
+
+    Only the most recently used compositions are kept, so composees aren't kept
+    alive forever.
+    """
+    return _composition(type_, fields_, name_, build, (), {})
+
+
+def _composition(
+    type_: type,
+    fields_: Sequence[Tuple[str, str]],
+    name_: str,
+    build: bool,
+    args: Tuple,
+    kwargs: Dict[str, Any],
+) -> type:
+    """Build the inheritable type for Compose.
+
+    :param type_: the type to composee
+    :param fields_: the (origin, destination) pairs of the fields to forward
+    :param name_: the name to give the composee
+    :param build: enable the automatic generation of a composee instance
+    :param args: the positional arguments to call the constructor of type_ with
+    :param kwargs: the keyword arguments to call the constructor of type_ with
+    :return: the inheritable type
+    """
+    factory: Optional[Callable[[], Any]] = None
+    if build and not isinstance(type_, InterfaceMeta):
+        factory = partial(type_, *args, **kwargs) if args or kwargs else type_
+    required = tuple(origin for origin, _ in fields_)
+    # direct instances of type_ can't lack fields that are plain class attributes
+    # of type_, subclasses may still override them
+    on_class = not isinstance(type_, InterfaceMeta) and all(
+        _is_plain_class_attr(type_, attr) for attr in required
+    )
+
+    # stored on each concrete subclass: whether only object.__init__ is left to
+    # call after this composition's __init__
+    chain_flag = f"_{name_}_ends_init_chain"
+
+    def __init__(self, *args_, **kwargs_):
+        obj = kwargs_.pop(name_, None)
+        if not obj:
+            if factory is not None:
+                obj = factory()
+            else:
+                raise ValueError(
+                    f"Need to provide a instance of type {type_} under kwarg {name_}."
+                )
+        elif isinstance(type_, InterfaceMeta) and not isimplementation(
+            type(obj), type_
+        ):
+            raise TypeError(f"Passed instance doesn't implement {type_}")
+        if not (on_class and type(obj) is type_):
+            missing = [attr for attr in required if not hasattr(obj, attr)]
+            if missing:
                 raise TypeError(
                     "Can't initialize class due to missing fields required by composition "
                     f"(composite: {self.__class__}, composee: {type_}).\n"
-                    f"Missing fields: {[attr for attr, _ in fields_ if not hasattr(obj, attr)]}"
+                    f"Missing fields: {missing}"
                 )
-            setattr(self, name_, obj)
-            super().__init__(*args_, **kwargs_)
-
+        setattr(self, name_, obj)
+        if args_ or kwargs_:
+            super(InheritableComposition, self).__init__(*args_, **kwargs_)
+            return
+        cls = type(self)
+        ends_chain = vars(cls).get(chain_flag)
+        if ends_chain is None:
+            ends_chain = super(InheritableComposition, cls).__init__ is object.__init__
+            setattr(cls, chain_flag, ends_chain)
+        if not ends_chain:
+            super(InheritableComposition, self).__init__()
+
+    # the forwarding properties live on the composition itself, so subclasses
+    # simply inherit them
+    namespace: Dict[str, Any] = {
+        dest: _build_field(name_, origin) for origin, dest in fields_
+    }
+    namespace["__init__"] = __init__
+    # no instance layout of its own, so subclasses are free to use __slots__
+    namespace["__slots__"] = ()
+    InheritableComposition = type("InheritableComposition", (), namespace)
     return InheritableComposition
 
 
+def _is_plain_class_attr(type_: type, attr: str) -> bool:
+    """Return whether an attribute is defined on a type and isn't a descriptor.
+
+    Descriptors (slots, properties, ...) may still be missing on instances.
+
+    :param type_: the type to look the attribute up on
+    :param attr: the attribute to look up
+    """
+    for base in type_.__mro__:
+        if attr in vars(base):
+            return not hasattr(type(vars(base)[attr]), "__get__")
+    return False
+
+
 def _build_field(name: str, field: str) -> property:
     """Build a single forwarding property to encompass the requested field
     
@@ -99,15 +180,13 @@ def _build_field(name: str, field: str) -> property:
     :param field: the field to forward
     :return: the generated property
     """
+    getter = attrgetter(f"{name}.{field}")
     obj_getter = attrgetter(name)
 
-    def getter(self):
-        return getattr(obj_getter(self), field)
-
-    def setter(self, value):
-        return setattr(obj_getter(self), field, value)
+    def setter(self, value, _obj_getter=obj_getter, _field=field):
+        return setattr(_obj_getter(self), _field, value)
 
-    def deleter(self):
-        return delattr(obj_getter(self), field)
+    def deleter(self, _obj_getter=obj_getter, _field=field):
+        return delattr(_obj_getter(self), _field)
 
     return property(getter, setter, deleter)
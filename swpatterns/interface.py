@@ -5,7 +5,13 @@ __all__ = ("Interface", "implements", "isimplementation")
 
 
 INTERFACE_LIST_NAME = "__interfaces__"
-NONE_RELEVANT_VARS = ("__module__", "__doc__")
+CHECKLIST_NAME = "_iface_checklist"
+NONE_RELEVANT_VARS = ("__module__", "__doc__", CHECKLIST_NAME)
+
+# parameter count, return annotation and a (kind, annotation, name) triple per parameter
+_Spec = Tuple[int, Any, Tuple[Tuple[Any, Any, str], ...]]
+# (kind, annotation) pair per parameter and return annotation
+_SigKey = Tuple[Tuple[Tuple[Any, Any], ...], Any]
 
 
 class InterfaceMeta(type):
@@ -41,12 +47,12 @@ def implements(
 
     def inner(cls: type) -> type:
         _perform_check(cls, interface, skip_types, verbose=True)
-        original = getattr(cls, INTERFACE_LIST_NAME, tuple())
-        setattr(
-            cls,
-            INTERFACE_LIST_NAME,
-            ((interface,) + original if interface not in original else original),
+        # collect the registrations along the whole mro, so lookups on cls
+        # never have to walk it again
+        registered = frozenset((interface,)).union(
+            *(vars(base).get(INTERFACE_LIST_NAME, ()) for base in cls.__mro__)
         )
+        setattr(cls, INTERFACE_LIST_NAME, registered)
         return cls
 
     return inner
@@ -75,6 +81,9 @@ def isimplementation(
         raise TypeError(
             f"Can only check for implementation of interfaces: {interface_or_tuple}"
         )
+    registered = getattr(impl, INTERFACE_LIST_NAME, None)
+    if registered is not None:
+        return not registered.isdisjoint(interfaces)
     return any(
         getattr(interface, "__implementationcheck__")(impl) for interface in interfaces
     )
@@ -90,18 +99,14 @@ def _perform_check(
     :param skip_types: skip the checking of types/signatures
     :param verbose: throw verbose errors for decorator
     """
-    checklist = {
-        key: value
-        for key, value in vars(interface).items()
-        if key not in NONE_RELEVANT_VARS
-    }
+    checklist = _checklist(interface)
     targets = {
         key: value for key, value in vars(impl).items() if key not in NONE_RELEVANT_VARS
     }
     if not checklist:
         # No checks to perform?!
         return True
-    for key, value in checklist.items():
+    for key, (value, spec, sigkey) in checklist.items():
         if key not in targets:
             if verbose:
                 raise KeyError(f"{key} is not implement/defined")
@@ -130,41 +135,148 @@ def _perform_check(
                 if verbose:
                     raise KeyError(f"{attr_key} is not defined")
                 return False
-        elif callable(value):
-            sig = inspect.signature(value)
-            impl_sig = inspect.signature(impl_value)
-            params = sig.parameters
-            impl_params = impl_sig.parameters
+        elif spec is not None:
+            impl_spec = _spec(impl_value)
+            if sigkey == _sigkey(impl_spec):
+                # identical kinds and annotations, nothing left to check
+                continue
+            n_params, return_annotation, params = spec
+            impl_n_params, impl_return_annotation, impl_params = impl_spec
             try:
-                if len(params) != len(impl_params):
+                if n_params != impl_n_params:
                     raise TypeError(
-                        f"wrong amount of parameters - should be {impl_sig}"
+                        f"wrong amount of parameters - should be {inspect.signature(impl_value)}"
                     )
                 if not skip_types:
                     if (
-                        sig.return_annotation is not sig.empty
-                        and sig.return_annotation != impl_sig.return_annotation
+                        return_annotation is not inspect.Signature.empty
+                        and return_annotation != impl_return_annotation
                     ):
                         raise TypeError(
-                            f"wrong return annotation - should be {sig.return_annotation}"
+                            f"wrong return annotation - should be {return_annotation}"
                         )
-                for i, (param, impl_param) in enumerate(
-                    zip(params.values(), impl_params.values())
-                ):
-                    if impl_param.kind is not param.kind:
+                for i, (param, impl_param) in enumerate(zip(params, impl_params)):
+                    kind, annotation, name = param
+                    impl_kind, impl_annotation, _ = impl_param
+                    if impl_kind is not kind:
                         raise TypeError(
-                            f"parameter {i}({param.name}) has wrong kind - should be {param.kind}"
+                            f"parameter {i}({name}) has wrong kind - should be {kind}"
                         )
                     if (
                         not skip_types
-                        and param.annotation is not param.empty
-                        and impl_param.annotation is not param.annotation
+                        and annotation is not inspect.Parameter.empty
+                        and impl_annotation is not annotation
                     ):
                         raise TypeError(
-                            f"parameter {i}({param.name}) has wrong annotation - should be {param.annotation}"
+                            f"parameter {i}({name}) has wrong annotation - should be {annotation}"
                         )
             except TypeError as e:
                 if verbose:
                     raise TypeError(f"{value}'s signature doesn't match: {e.args[0]}")
                 return False
     return True
+
+
+def _checklist(
+    interface: InterfaceMeta,
+) -> Dict[str, Tuple[Any, Optional[_Spec], Optional[_SigKey]]]:
+    """Return the (cached) members of an interface to check implementations against.
+
+    The checklist is built on first use and stored on the interface itself.
+
+    :param interface: the interface to get the checklist of
+    :return: the members by name, each with its flattened signature and signature key if it has one
+    """
+    checklist = vars(interface).get(CHECKLIST_NAME)
+    if checklist is None:
+        checklist = {}
+        for key, value in vars(interface).items():
+            if key in NONE_RELEVANT_VARS:
+                continue
+            try:
+                spec = _spec(value) if callable(value) else None
+            except ValueError:
+                # callables without a signature (builtins, ...) can't be compared
+                spec = None
+            checklist[key] = (value, spec, _sigkey(spec) if spec is not None else None)
+        setattr(interface, CHECKLIST_NAME, checklist)
+    return checklist
+
+
+def _sigkey(spec: _Spec) -> _SigKey:
+    """Return the comparison key of a flattened signature.
+
+    Two callables with equal keys have parameters of the same kinds and
+    annotations as well as the same return annotation.
+
+    :param spec: the flattened signature, see _spec
+    :return: a (kind, annotation) pair per parameter and the return annotation
+    """
+    _, return_annotation, params = spec
+    return (
+        tuple((kind, annotation) for kind, annotation, _ in params),
+        return_annotation,
+    )
+
+
+def _spec(func: Callable) -> _Spec:
+    """Flatten the signature of a callable into the parts relevant for checking.
+
+    Plain python functions are read straight from their code object, everything
+    else (builtins, partials, wrapped functions, ...) goes through inspect.
+
+    :param func: the callable to inspect
+    :return: the parameter count, the return annotation and a (kind, annotation, name) triple per parameter
+    """
+    if isinstance(func, staticmethod):
+        func = func.__func__
+    if (
+        inspect.isfunction(func)
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    ):
+        return _code_spec(func)
+    sig = inspect.signature(func)
+    params = tuple(
+        (param.kind, param.annotation, param.name)
+        for param in sig.parameters.values()
+    )
+    return len(params), sig.return_annotation, params
+
+
+def _code_spec(func: Callable) -> _Spec:
+    """Flatten the signature of a plain python function using its code object.
+
+    :param func: the function to inspect
+    :return: same as _spec
+    """
+    code = func.__code__
+    annotations = func.__annotations__
+    names = code.co_varnames
+    argcount = code.co_argcount
+    posonlycount = getattr(code, "co_posonlyargcount", 0)
+    kwonlycount = code.co_kwonlyargcount
+    kinds: List[Tuple[Any, str]] = [
+        (
+            inspect.Parameter.POSITIONAL_ONLY
+            if i < posonlycount
+            else inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            name,
+        )
+        for i, name in enumerate(names[:argcount])
+    ]
+    index = argcount + kwonlycount
+    if code.co_flags & inspect.CO_VARARGS:
+        kinds.append((inspect.Parameter.VAR_POSITIONAL, names[index]))
+        index += 1
+    kinds.extend(
+        (inspect.Parameter.KEYWORD_ONLY, name)
+        for name in names[argcount : argcount + kwonlycount]
+    )
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        kinds.append((inspect.Parameter.VAR_KEYWORD, names[index]))
+    params = tuple(
+        (kind, annotations.get(name, inspect.Parameter.empty), name)
+        for kind, name in kinds
+    )
+    return len(params), annotations.get("return", inspect.Signature.empty), params
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+from functools import lru_cache
 import sys
 from typing import (
     Any,
@@ -13,12 +13,20 @@ from typing import (
     TypeVar,
     Type,
     List,
+    MutableSet,
 )
+from weakref import WeakSet
 
 from .composition import Compose
 from .interface import Interface, implements, isimplementation
 
-__all__ = ("match", "_")
+__all__ = ("match", "compile_match", "_")
+
+
+# shared result of checks that match without passing anything on
+_EMPTY: Tuple = ()
+# weak, so validated branch types can still be garbage collected
+_BRANCH_TYPES: MutableSet[type] = WeakSet()
 
 
 def match(target: Any, *branches: MatchBranch) -> Any:
@@ -27,21 +35,97 @@ def match(target: Any, *branches: MatchBranch) -> Any:
     :param target: the target to perform branch checks on
     :param branches: the branches to check
     """
-    if not all(isimplementation(branch, _IMatchBranch) for branch in branches):
-        raise TypeError("Custom branches must implement `_IMatchBranch` interface.")
-    for i, branch in enumerate(branches):
+    _validate_branches(branches)
+    for branch in branches:
         check_result = branch.check(target)
         if check_result is not None:
             return branch.apply(check_result)
     return None
 
 
-@dataclass
+def compile_match(*branches: MatchBranch) -> Callable[[Any], Any]:
+    """Compile branches into a single function matching a target against them.
+
+    The returned function behaves like `lambda target: match(target, *branches)`,
+    but the dispatch on the branch types is resolved once. Since the branches
+    are read at compile time, changing them afterwards has no effect.
+
+    :param branches: the branches to check
+    :return: the compiled match function
+    """
+    _validate_branches(branches)
+    namespace: Dict[str, Any] = {}
+    lines = ["def compiled_match(target):"]
+    for i, branch in enumerate(branches):
+        branch_type = type(branch)
+        if branch_type is MatchBranch:
+            namespace[f"func_{i}"] = branch._mb.func
+            lines.append(f"    return func_{i}()")
+            break
+        elif branch_type is Literal:
+            namespace[f"val_{i}"] = branch.check_val
+            namespace[f"func_{i}"] = branch._mb.func
+            lines.append(f"    if val_{i} == target:")
+            lines.append(f"        return func_{i}()")
+        elif branch_type is Conditional:
+            namespace[f"cond_{i}"] = branch.check_val
+            namespace[f"func_{i}"] = branch._mb.func
+            lines.append(f"    if cond_{i}(target):")
+            lines.append(f"        return func_{i}(target)")
+        else:
+            namespace[f"branch_{i}"] = branch
+            lines.append(f"    result = branch_{i}.check(target)")
+            lines.append("    if result is not None:")
+            lines.append(f"        return branch_{i}.apply(result)")
+    else:
+        lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace["compiled_match"]
+
+
+def _validate_branches(branches: Tuple[MatchBranch, ...]) -> None:
+    """Make sure all branches implement the branch interface.
+
+    :param branches: the branches to validate
+    :raises TypeError: a branch doesn't implement `_IMatchBranch`
+    """
+    for branch in branches:
+        branch_type = type(branch)
+        if branch_type not in _BRANCH_TYPES:
+            if not isimplementation(branch_type, _IMatchBranch):
+                raise TypeError(
+                    "Custom branches must implement `_IMatchBranch` interface."
+                )
+            _BRANCH_TYPES.add(branch_type)
+
+
+@lru_cache(maxsize=128)
+def _struct_type(type_: type) -> Type[Struct]:
+    """Build the struct branch type for a target type.
+
+    Only the most recently used types are kept, so target types aren't kept
+    alive forever.
+
+    :param type_: the type to match against
+    :return: the struct branch type
+    """
+    return type(
+        f"{type_.__name__}MatchBranch", (Struct,), {"_type": type_, "__slots__": ()}
+    )
+
+
+def _default_func() -> None:
+    return None
+
+
 class _MatchBranchData:
     """MatchBranch data holder."""
 
-    check_val: Any = field(init=False, default=None)
-    func: Callable = field(init=False, default=lambda: None)
+    __slots__ = ("check_val", "func")
+
+    def __init__(self) -> None:
+        self.check_val: Any = None
+        self.func: Callable = _default_func
 
 
 class _IMatchBranch(Interface):
@@ -57,6 +141,8 @@ class MatchBranch(
 ):
     """Match branch with no checks."""
 
+    __slots__ = ("_mb",)
+
     def __init_subclass__(cls, symbol: Optional[str] = None) -> None:
         if symbol is not None:
             setattr(MatchBranch, symbol, cls)
@@ -70,9 +156,11 @@ class MatchBranch(
         return self
 
     def check(self, target: Any) -> Optional[Tuple]:
-        return tuple()
+        return _EMPTY
 
     def apply(self, args: Tuple) -> Any:
+        if args is _EMPTY:
+            return self._mb.func()
         return self._mb.func(*args)
 
 
@@ -83,11 +171,13 @@ _ = MatchBranch
 class Literal(MatchBranch, symbol="l"):
     """Matching branch with a literal compare value."""
 
+    __slots__ = ()
+
     check_val: Any
 
     def check(self, target: Any) -> Optional[Tuple]:
         if self.check_val == target:
-            return tuple()
+            return _EMPTY
         return None
 
 
@@ -95,6 +185,8 @@ class Literal(MatchBranch, symbol="l"):
 class Conditional(MatchBranch, symbol="c"):
     """Matching branch with a conditional."""
 
+    __slots__ = ()
+
     check_val: Callable
 
     def check(self, target: Any) -> Optional[Tuple]:
@@ -107,27 +199,57 @@ class Conditional(MatchBranch, symbol="c"):
 class Struct(MatchBranch, symbol="s"):
     """Matching branch with 'struct' decomposition."""
 
+    __slots__ = ("_plan",)
+
     _type: type
+    _plan: Tuple[
+        Tuple[Tuple, Dict],
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Tuple[Tuple[str, Any, bool], ...],
+    ]
     check_val: Tuple[Tuple, Dict]
 
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.check_val = (args, kwargs)
+        self._plan = self._build_plan(self.check_val)
 
     def __class_getitem__(cls, type_: type) -> Type[Struct]:
-        return type(f"{type_.__name__}MatchBrach", (Struct,), {"_type": type_})
+        return _struct_type(type_)
+
+    @staticmethod
+    def _build_plan(check_val: Tuple[Tuple, Dict]) -> Tuple:
+        """Work out what check needs from a check value up front.
+
+        :param check_val: the attributes to pass on and the attributes to compare
+        :return: check_val itself, the attributes to pass on, all attributes to
+                 fetch and an (attribute, value, is predicate) triple per comparison
+        """
+        args, kwargs = check_val
+        return (
+            check_val,
+            args,
+            tuple(dict.fromkeys(args + tuple(kwargs))),
+            tuple((attr, val, callable(val)) for attr, val in kwargs.items()),
+        )
 
     def check(self, target: Any) -> Optional[Tuple]:
-        if isinstance(target, self._type):
-            args, kwargs = self.check_val
+        type_ = self._type
+        if type(target) is type_ or isinstance(target, type_):
+            plan = self._plan
+            check_val = self.check_val
+            if plan[0] is not check_val:
+                # check_val was reassigned
+                plan = self._plan = self._build_plan(check_val)
+            _, args, attrs, checks = plan
             try:
+                values = {attr: getattr(target, attr) for attr in attrs}
                 if all(
-                    getattr(target, attr) == val
-                    if not callable(val)
-                    else val(getattr(target, attr))
-                    for attr, val in kwargs.items()
+                    val(values[attr]) if is_callable else values[attr] == val
+                    for attr, val, is_callable in checks
                 ):
-                    return tuple(getattr(target, attr) for attr in args)
+                    return tuple(values[attr] for attr in args)
             except AttributeError:
                 ...
         return None
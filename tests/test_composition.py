@@ -1,4 +1,6 @@
+import gc
 import unittest
+import weakref
 from swpatterns.composition import Compose
 from swpatterns.interface import Interface, implements, isimplementation
 
@@ -44,6 +46,36 @@ class TestCompose(unittest.TestCase):
         self.assertEqual(c2._a, a)
         self.assertEqual(c2._b, b)
 
+    def test_cooperative(self):
+        """Composition followed by a base with its own constructor."""
+
+        class A:
+            ...
+
+        class M:
+            def __init__(self, flag=True):
+                self.flag = flag
+
+        class B(Compose(A), M):
+            ...
+
+        self.assertTrue(B().flag)
+        self.assertFalse(B(flag=False).flag)
+
+        class C(Compose(A)):
+            ...
+
+        with self.assertRaises(TypeError):
+            C(flag=False)
+
+        C()
+        self.assertIs(vars(C)["__a_ends_init_chain"], True)
+        self.assertIs(vars(B)["__a_ends_init_chain"], False)
+        ref = weakref.ref(C)
+        del C
+        gc.collect()
+        self.assertIsNone(ref())
+
     def test_rename(self):
         """Simple composition with renaming, but without forwarding."""
 
@@ -80,6 +112,73 @@ class TestCompose(unittest.TestCase):
         b = B()
         self.assertEqual(b.var, A.test)
 
+    def test_forwarding_setdel(self):
+        """Simple composition with forwarding of attribute assignment and deletion."""
+
+        class A:
+            def __init__(self):
+                self.test = "123"
+
+        class B(Compose(A, "test")):
+            ...
+
+        b = B()
+        b.test = "456"
+        self.assertEqual(b._a.test, "456")
+        del b.test
+        self.assertFalse(hasattr(b._a, "test"))
+
+    def test_missing(self):
+        """Composition with a composee lacking a forwarded field."""
+
+        class A:
+            def __init__(self, x=None):
+                if x is not None:
+                    self.x = x
+
+        class B(Compose(A, "x")):
+            ...
+
+        with self.assertRaises(TypeError):
+            B()
+        self.assertEqual(B(_a=A("123")).x, "123")
+
+        class C:
+            __slots__ = ("x",)
+
+        class D(Compose(C, "x")):
+            ...
+
+        with self.assertRaises(TypeError):
+            D()
+
+        class E:
+            @property
+            def x(self):
+                raise AttributeError("x")
+
+        class F(Compose(E, "x")):
+            ...
+
+        with self.assertRaises(TypeError):
+            F()
+
+        class G:
+            x = "123"
+
+        class H(Compose(G, "x")):
+            ...
+
+        self.assertEqual(H().x, "123")
+
+        class G2(G):
+            @property
+            def x(self):
+                raise AttributeError("x")
+
+        with self.assertRaises(TypeError):
+            H(_g=G2())
+
     def test_full(self):
         """Test all other things together."""
 
@@ -128,6 +227,68 @@ class TestCompose(unittest.TestCase):
         b = B()
         self.assertEqual(b.x, "123")
 
+        class C(Compose(A, "x", args=("456",))):
+            ...
+
+        c = C()
+        self.assertEqual(c.x, "456")
+
+    def test_slots(self):
+        """Compositions don't force an instance dict onto their subclasses."""
+
+        class A:
+            test = "123"
+
+        class B(Compose(A, "test")):
+            __slots__ = ("_a",)
+
+        b = B()
+        self.assertFalse(hasattr(b, "__dict__"))
+        self.assertEqual(b.test, "123")
+
+    def test_cache(self):
+        """Composition types are reused for identical arguments."""
+
+        class A:
+            def __init__(self, x=None):
+                self.x = x
+
+        self.assertIs(Compose(A, "x"), Compose(A, "x"))
+        self.assertIsNot(Compose(A, "x"), Compose(A, ("x", "y")))
+        self.assertIsNot(Compose(A, "x"), Compose(A, "x", kwargs={"x": 1}))
+        self.assertIsNot(
+            Compose(A, "x", kwargs={"x": 1}), Compose(A, "x", kwargs={"x": 1})
+        )
+
+        class C(Compose(A, "x", args=(1,))):
+            ...
+
+        class D(Compose(A, "x", args=(True,))):
+            ...
+
+        self.assertIs(C().x, 1)
+        self.assertIs(D().x, True)
+
+        class B(Compose(A, "x", kwargs={"x": []})):
+            ...
+
+        self.assertEqual(B().x, [])
+
+    def test_cache_bounded(self):
+        """Composees aren't kept alive by the composition cache forever."""
+
+        refs = []
+        for _ in range(200):
+
+            class A:
+                ...
+
+            Compose(A)
+            refs.append(weakref.ref(A))
+        del A
+        gc.collect()
+        self.assertIsNone(refs[0]())
+
     def test_interface(self):
         """Composition with interfaces"""
 
@@ -1,5 +1,10 @@
+import functools
+import gc
+import inspect
+import sys
+import weakref
 import unittest
-from swpatterns.interface import Interface, implements, isimplementation
+from swpatterns.interface import Interface, implements, isimplementation, _spec
 
 __all__ = ("TestInterface",)
 
@@ -99,3 +104,244 @@ class TestInterface(unittest.TestCase):
                 return a + 1
 
         self.assertTrue(isimplementation(A, I))
+
+    def test_multiple(self):
+        """Implementation of multiple interfaces checked against a tuple."""
+
+        class I(Interface):
+            def test(self, a):
+                ...
+
+        class J(Interface):
+            def other(self):
+                ...
+
+        class K(Interface):
+            ...
+
+        @implements(I)
+        @implements(J)
+        class A:
+            def test(self, a):
+                return a + 1
+
+            def other(self):
+                return None
+
+        self.assertTrue(isimplementation(A, I))
+        self.assertTrue(isimplementation(A, J))
+        self.assertTrue(isimplementation(A, (K, J)))
+        self.assertFalse(isimplementation(A, K))
+        self.assertFalse(isimplementation(int, (I, J)))
+
+    def test_inheritance(self):
+        """Implementations inherit the registrations of all their bases."""
+
+        class I(Interface):
+            def test(self):
+                ...
+
+        class J(Interface):
+            def other(self):
+                ...
+
+        class K(Interface):
+            ...
+
+        @implements(I)
+        class A:
+            def test(self):
+                ...
+
+        @implements(J)
+        class B:
+            def other(self):
+                ...
+
+        @implements(K)
+        class C(A, B):
+            ...
+
+        self.assertTrue(isimplementation(C, (I,)))
+        self.assertTrue(isimplementation(C, J))
+        self.assertTrue(isimplementation(C, K))
+        self.assertFalse(isimplementation(A, K))
+
+    def test_signature(self):
+        """Interface with implementations not matching the signature."""
+
+        class I(Interface):
+            def test(self, a, *, b):
+                ...
+
+        @implements(I)
+        class A:
+            def test(self, x, *, y):
+                ...
+
+        self.assertTrue(isimplementation(A, I))
+
+        with self.assertRaises(TypeError):
+
+            @implements(I)
+            class B:
+                def test(self, a, b):
+                    ...
+
+        with self.assertRaises(TypeError):
+
+            @implements(I)
+            class C:
+                def test(self, a):
+                    ...
+
+    def test_checklist(self):
+        """Interfaces build their checklist once, on first use."""
+
+        class I(Interface):
+            factory = int
+
+            def test(self, a: int) -> int:
+                ...
+
+        self.assertNotIn("_iface_checklist", vars(I))
+
+        @implements(I)
+        class A:
+            factory = int
+
+            def test(self, a: int) -> int:
+                return a
+
+        self.assertTrue(isimplementation(A, I))
+
+        class J(Interface):
+            def test(self, a: int) -> int:
+                ...
+
+        @implements(J)
+        class B:
+            def test(self, a: int) -> int:
+                return a
+
+        checklist = vars(J)["_iface_checklist"]
+        self.assertEqual(list(checklist), ["test"])
+
+        @implements(J)
+        class C:
+            def test(self, b: int) -> int:
+                return b
+
+        self.assertIs(vars(J)["_iface_checklist"], checklist)
+        self.assertTrue(isimplementation(C, J))
+
+    def test_no_retention(self):
+        """Checked implementations aren't kept alive by the interface machinery."""
+
+        class I(Interface):
+            def test(self, a: int) -> int:
+                ...
+
+        @implements(I)
+        class A:
+            def test(self, a: int) -> int:
+                return a
+
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @implements(I)
+        class B:
+            @decorate
+            def test(self, a: int) -> int:
+                return a
+
+        refs = [weakref.ref(vars(A)["test"]), weakref.ref(vars(B)["test"])]
+        del A, B
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None, None])
+
+    def test_spec(self):
+        """Flattened signatures match inspect.signature for all parameter layouts."""
+
+        def reference(func):
+            sig = inspect.signature(func)
+            params = tuple(
+                (param.kind, param.annotation, param.name)
+                for param in sig.parameters.values()
+            )
+            return len(params), sig.return_annotation, params
+
+        def plain(self, a, b=1):
+            ...
+
+        # positional-only parameters are a syntax error before 3.8
+        namespace: dict = {}
+        exec(
+            "def positional(a: int, /, b: str, *, c: float = 1.0) -> None: ..."
+            if sys.version_info >= (3, 8)
+            else "def positional(a: int, b: str, *, c: float = 1.0) -> None: ...",
+            namespace,
+        )
+        positional = namespace["positional"]
+
+        def variadic(self, *args: int, key, **kwargs: str) -> int:
+            local = 1
+            return local
+
+        def keywords(**kwargs):
+            ...
+
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        for func in (
+            plain,
+            positional,
+            variadic,
+            keywords,
+            decorate(positional),
+            functools.partial(positional, 1),
+            len,
+        ):
+            self.assertEqual(_spec(func), reference(func), func)
+        self.assertEqual(_spec(staticmethod(variadic)), reference(variadic))
+
+    def test_decorated(self):
+        """Interface with a decorated implementation."""
+
+        class I(Interface):
+            def test(self, a: int) -> int:
+                ...
+
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @implements(I)
+        class A:
+            @decorate
+            def test(self, a: int) -> int:
+                return a + 1
+
+        self.assertTrue(isimplementation(A, I))
+        self.assertEqual(A().test(1), 2)
+
+        with self.assertRaises(TypeError):
+
+            @implements(I)
+            class B:
+                @decorate
+                def test(self, a: str) -> int:
+                    return 1
@@ -1,5 +1,7 @@
+import gc
 import unittest
-from swpatterns.matching import match, _
+import weakref
+from swpatterns.matching import match, compile_match, _
 
 __all__ = ("TestMatching",)
 
@@ -37,6 +39,7 @@ class TestMatching(unittest.TestCase):
                 self.x = x
                 self.y = y
 
+        self.assertIs(_.s[A], _.s[A])
         a1 = A(1)
         res = match(a1, _.s[A]("x") >> (lambda x: x))
         self.assertEqual(res, 1)
@@ -44,3 +47,75 @@ class TestMatching(unittest.TestCase):
         self.assertEqual(res, None)
         res = match(a1, _.s[A]("y", x=lambda x: x % 2 == 1) >> (lambda y: y))
         self.assertEqual(res, None)
+        res = match(a1, _.s[A]("x", "y", x=1) >> (lambda x, y: (x, y)))
+        self.assertEqual(res, (1, None))
+        res = match(a1, _.s[A]("z") >> 1, _() >> 2)
+        self.assertEqual(res, 2)
+
+        branch = _.s[A]("x") >> (lambda x: x)
+        branch.check_val = (("y",), {})
+        res = match(a1, branch)
+        self.assertEqual(res, None)
+        branch.check_val = (("x",), {"y": None})
+        res = match(a1, branch)
+        self.assertEqual(res, 1)
+
+    def test_invalid_branch(self):
+        """Matching with a branch not implementing the branch interface."""
+
+        class B:
+            def check(self, target):
+                return tuple()
+
+        with self.assertRaises(TypeError):
+            match(1, B())
+        with self.assertRaises(TypeError):
+            match(1, _() >> 1, B())
+
+    def test_compiled(self):
+        """Matching with a compiled set of branches."""
+
+        class A:
+            def __init__(self, x):
+                self.x = x
+
+        matcher = compile_match(
+            _.l(2) >> "two",
+            _.c(lambda x: isinstance(x, int)) >> (lambda x: x + 1),
+            _.s[A]("x") >> (lambda x: x),
+            _() >> "default",
+        )
+        self.assertEqual(matcher(2), "two")
+        self.assertEqual(matcher(3), 4)
+        self.assertEqual(matcher(A("x")), "x")
+        self.assertEqual(matcher("y"), "default")
+        self.assertEqual(compile_match(_.l(1) >> 2)(3), None)
+
+        branch = _() >> "a"
+        self.assertEqual(compile_match(branch)(1), "a")
+        branch >> "b"
+        self.assertEqual(compile_match(branch)(1), "b")
+
+    def test_struct_types_bounded(self):
+        """Target types aren't kept alive by struct branch types forever."""
+
+        refs = []
+        for i in range(200):
+
+            class A:
+                ...
+
+            match(A(), _.s[A]() >> i)
+            refs.append(weakref.ref(A))
+        del A
+        gc.collect()
+        self.assertIsNone(refs[0]())
+
+    def test_slots(self):
+        """Match branches don't carry an instance dict."""
+
+        class A:
+            ...
+
+        for branch in (_(), _.l(1), _.c(bool), _.s[A](), _.s[A]("x", y=1)):
+            self.assertFalse(hasattr(branch, "__dict__"), branch)